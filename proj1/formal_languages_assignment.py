@@ -2,6 +2,8 @@
 # Student ID: W01367741
 # Date: 10/1/2025
 
+from functools import lru_cache
+
 def is_in_language_L(string):
     """
     Check if a string belongs to language L = {a^n b^n | n >= 1}
@@ -19,20 +21,13 @@ def is_in_language_L(string):
         is_in_language_L("aba") -> False
         is_in_language_L("") -> False
     """
-    # count all the a's and b's
-    num_as = string.count('a')
-    num_bs = string.count('b')
-
-    # ensure there are an equal number greater than 0
-    if num_as != num_bs or num_as == 0:
-        return False
-
-    # make sure no a's are present in the second half of the string
-    if 'a' in string[num_as:]:
+    # the string must split into two non-empty halves of equal length
+    n = len(string) // 2
+    if n == 0 or len(string) % 2:
         return False
 
-    # default case
-    return True
+    # first half all a's, second half all b's, counted in place without slicing
+    return string.count('a', 0, n) == n and string.count('b', n) == n
 
 def kleene_closure_generator(base_language, max_length):
     """
@@ -52,15 +47,16 @@ def kleene_closure_generator(base_language, max_length):
         - "aa", "abb", "bba", "bbbb" (from L²)
         - etc.
     """
-    final = set([''])
-    for _ in range(max_length):
-        # for each layer
+    # by_len[k] holds every string in L* of length exactly k, built by putting
+    # a word from the base language in front of a shorter string in L*
+    by_len = [set() for _ in range(max(max_length, 0) + 1)]
+    by_len[0].add('')
+    for k in range(1, max_length + 1):
         for string in base_language:
-            small_set = set()
-            for item in final:
-                small_set.add(string + item)
-            final = final.union(small_set)
-    return final
+            # the empty word adds nothing new to L*
+            if 0 < len(string) <= k:
+                by_len[k].update(string + item for item in by_len[k - len(string)])
+    return set().union(*by_len)
 
 
 def generate_recursive_language_M(n):
@@ -79,7 +75,8 @@ def generate_recursive_language_M(n):
         generate_recursive_language_M(2) -> "yyxzz"
         generate_recursive_language_M(3) -> "yyyxzzz"
     """
-    return "y" + generate_recursive_language_M(n-1) + "z" if n > 0 else "x"
+    # M(n) = y M(n-1) z unrolls to n y's around the x and n z's
+    return "y" * n + "x" + "z" * n
 
 
 def regex_match(pattern, string):
@@ -107,75 +104,145 @@ def regex_match(pattern, string):
         regex_match("a|b", "a") -> True
         regex_match("a|b", "c") -> False
     """
-    if "|*" in pattern:
-        raise Exception("Bad pattern. '|*' can not be present")
-    if pattern.startswith("*"):
-        raise Exception("Bad pattern. Cannot start pattern with '*'.")
+    table, accept = _compile(pattern)
+    return _run_dfa(table, accept, string)
 
-    # final variable used to keep track of whether it matches
-    does_match = False
 
-    # split up the unions
-    pats = pattern.split('|')
-    for pat in pats:
-        is_matching = True
+def _run_dfa(table, accept, string):
+    """
+    Run a compiled DFA over a string
 
-        # in here, there is only concatenation and the kleene *
-        i = 0
-        blocks = []
-        while i < len(pat):
-            # look for * if not the last character
-            # to build the blocks
-            if i != len(pat) - 1 and pat[i+1] == '*':
-                blocks.append((pat[i], True)) # True because has Kleene star
-                i += 2
-            else:
-                blocks.append((pat[i], False)) # False because no Kleene star
-                i += 1
+    Args:
+        table (tuple): Per-state dicts of char -> next state
+        accept (tuple): Accepting flag for each state
+        string (str): String to run
 
+    Returns:
+        bool: True if the DFA ends in an accepting state, False otherwise
+    """
+    # a missing transition is the dead state, so stop as soon as we hit one
+    state = 0
+    for char in string:
+        state = table[state].get(char)
+        if state is None:
+            return False
+    return accept[state]
 
-        b_ptr = 0
-        for char in string:
-            if b_ptr >= len(blocks):
-                is_matching = False
-                break
 
-            # find all valid chars based on b_ptr
-            keep_looking = True
-            valid = []
-            diff = 0
-            while keep_looking:
-                if b_ptr + diff == len(blocks):
-                    break
+@lru_cache(maxsize=256)
+def _compile(pattern):
+    """
+    Compile a pattern into a minimal DFA
 
-                valid.append(blocks[b_ptr + diff][0])
-                keep_looking = blocks[b_ptr + diff][1] # does this have Kleene *
-                diff += 1
+    The pattern is built into an NFA with Thompson's construction, turned into
+    a DFA with the subset construction and then minimized by partition
+    refinement.
 
-            first_match = -1
-            for i, v in enumerate(valid):
-                if char == v:
-                    first_match = i
-                    break
+    Args:
+        pattern (str): Regular expression pattern
 
-            if first_match < 0:
-                is_matching = False
+    Returns:
+        tuple: (table, accept) where table[state] is a dict of char -> next
+        state and accept[state] is True for accepting states. State 0 is the
+        start state.
+    """
+    if "|*" in pattern:
+        raise Exception("Bad pattern. '|*' can not be present")
+    if pattern.startswith("*"):
+        raise Exception("Bad pattern. Cannot start pattern with '*'.")
 
-            if blocks[b_ptr][1]: # if this one is Kleene *
-                b_ptr += first_match
-                if not blocks[b_ptr][1]: # if that one is not Kleene *
-                    b_ptr += 1
+    # thompson nfa, eps[i] holds the epsilon moves and edges[i] the labelled ones
+    eps = []
+    edges = []
 
-            else:
-                b_ptr += 1
+    def new_state():
+        eps.append([])
+        edges.append([])
+        return len(eps) - 1
 
-        if is_matching:
-            # we got through all the chars in the string but there
-            # may still be another block to evaluate
-            remaining = [x[1] for x in blocks[b_ptr:]]
-            does_match = all(remaining)
+    start = new_state()
+    final = new_state()
+    for pat in pattern.split('|'):
+        cur = new_state()
+        eps[start].append(cur)
+        i = 0
+        while i < len(pat):
+            char = pat[i]
+            i += 1
+            has_star = False
+            while i < len(pat) and pat[i] == '*':
+                has_star = True # a** is the same as a*
+                i += 1
 
-    return does_match
+            nxt = new_state()
+            if has_star:
+                enter = new_state()
+                leave = new_state()
+                eps[cur] += [enter, nxt]
+                edges[enter].append((char, leave))
+                eps[leave] += [enter, nxt]
+            else:
+                edges[cur].append((char, nxt))
+            cur = nxt
+        eps[cur].append(final)
+
+    def closure(states):
+        seen = set(states)
+        todo = list(states)
+        while todo:
+            for nxt in eps[todo.pop()]:
+                if nxt not in seen:
+                    seen.add(nxt)
+                    todo.append(nxt)
+        return frozenset(seen)
+
+    # subset construction
+    first = closure([start])
+    ids = {first: 0}
+    subsets = [first]
+    trans = []
+    for subset in subsets: # grows while we iterate
+        moves = {}
+        for s in subset:
+            for char, nxt in edges[s]:
+                moves.setdefault(char, set()).add(nxt)
+        row = {}
+        for char, targets in moves.items():
+            target = closure(targets)
+            if target not in ids:
+                ids[target] = len(subsets)
+                subsets.append(target)
+            row[char] = ids[target]
+        trans.append(row)
+    is_final = [final in subset for subset in subsets]
+
+    # minimize by splitting blocks until every state in a block agrees on
+    # where each character leads
+    alphabet = sorted(set(pattern) - set('|*'))
+    block = [int(f) for f in is_final]
+    num_blocks = len(set(block))
+    while True:
+        signatures = {}
+        new_block = []
+        for s, row in enumerate(trans):
+            sig = (block[s],) + tuple(block[row[c]] if c in row else -1 for c in alphabet)
+            new_block.append(signatures.setdefault(sig, len(signatures)))
+        block = new_block
+        if len(signatures) == num_blocks:
+            break
+        num_blocks = len(signatures)
+
+    # renumber the blocks so the start state is 0
+    order = {block[0]: 0}
+    for b in block:
+        order.setdefault(b, len(order))
+    table = [None] * num_blocks
+    accept = [False] * num_blocks
+    for s, row in enumerate(trans):
+        b = order[block[s]]
+        table[b] = {c: order[block[t]] for c, t in row.items()}
+        accept[b] = is_final[s]
+    return tuple(table), tuple(accept)
 
 
 
@@ -190,6 +257,7 @@ def test_assignment():
     assert is_in_language_L("") == False
     assert is_in_language_L("a") == False
     assert is_in_language_L("b") == False
+    assert is_in_language_L("acb") == False
     
     # Test Task 2: Kleene closure
     result = kleene_closure_generator(["a"], 3)
@@ -216,6 +284,9 @@ def test_assignment():
     assert regex_match("a|b", "c") == False
     assert regex_match("ab", "ab") == True
     assert regex_match("ab", "a") == False
+    assert regex_match("ab*c*d", "ad") == True
+    assert regex_match("ab*c*d", "abbccd") == True
+    assert regex_match("ab*c*d", "acbd") == False
     
     print("All tests passed!")
 
@@ -1,5 +1,11 @@
+import string
 from typing import List, Tuple
 
+# terminals are lowercase, nonterminals are uppercase
+_LOWER = frozenset(string.ascii_lowercase)
+_UPPER = frozenset(string.ascii_uppercase)
+_LETTERS = _LOWER | _UPPER
+
 def is_regular_grammar(productions: List[Tuple[str, List[str]]]) -> bool:
     """
     Check if a grammar is regular.
@@ -14,10 +20,9 @@ def is_regular_grammar(productions: List[Tuple[str, List[str]]]) -> bool:
     -------
     bool    True if grammar is regular, False otherwise
     """
-    # terminals are lowercase, nonterminals are uppercase
     for lhs, rhss in productions:
         # ensure lhs is a single uppercase letter
-        if not (lhs.isalpha() and len(lhs) == 1 and lhs.upper() == lhs):
+        if lhs not in _UPPER:
             return False
 
         for rhs in rhss:
@@ -25,19 +30,14 @@ def is_regular_grammar(productions: List[Tuple[str, List[str]]]) -> bool:
             if len(rhs) < 1:
                 return False
             elif len(rhs) == 1:
-                # check for '^' first
-                if rhs == '^':
-                    continue
-
-                # must be a terminal
-                if not (rhs.isalpha() and rhs.lower() == rhs):
+                # must be '^' or a terminal
+                if rhs != '^' and rhs not in _LOWER:
                     return False
-            else: # 
-                if not rhs.isalpha():
+            else:
+                # non-terminal may only be at the end, all others must be terminals
+                if rhs[-1] not in _LETTERS:
                     return False
-
-                # non-terminal must be at the end, all others must be lower-case
-                if not (rhs[:-1].lower() == rhs[:-1]):
+                if not all(c in _LOWER for c in rhs[:-1]):
                     return False
 
     return True
@@ -56,32 +56,32 @@ def recursive_parser(s: str) -> bool:
     -------
     bool: True if string is balanced, False otherwise
     """
-    opening_brackets = ['[', '(', '{']
-    closing_brackets = [']', ')', '}']
-
-    # find first opening bracket
-    min_open_idx = len(s) + 1
-    first_bracket = ''
-    for bracket in opening_brackets:
-        idx = s.find(bracket)
-        if idx >= 0 and idx < min_open_idx:
-            min_open_idx = idx
-            first_bracket = bracket
-
-    if not first_bracket:
-        # make sure there isn't a closing bracket if no opening brackets were found
-        for bracket in closing_brackets:
-            if bracket in s:
-                return False
-        else:
-            return True
-
-    # find its pair at the end
-    close_idx = s.rfind(closing_brackets[opening_brackets.index(first_bracket)])
-    if close_idx == -1:
-        return False
-
-    return recursive_parser(s[min_open_idx+1:close_idx]) and recursive_parser(s[close_idx+1:])
+    matching_close = {'[': ']', '(': ')', '{': '}'}
+    n = len(s)
+
+    def parse_sequence(i: int) -> int:
+        """
+        Consume a balanced sequence starting at index i.
+
+        Returns the index of the first unconsumed character: either a closing
+        bracket that ends this level or len(s). Returns -1 on a mismatch.
+        """
+        while i < n:
+            c = s[i]
+            if c in matching_close:
+                # the inner sequence must stop right on the matching bracket
+                j = parse_sequence(i + 1)
+                if j < 0 or j == n or s[j] != matching_close[c]:
+                    return -1
+                i = j + 1
+            elif c in ')]}':
+                return i
+            else:
+                i += 1
+        return n
+
+    # a closing bracket left over at the top level has no opening pair
+    return parse_sequence(0) == n
 
 
 def stack_checker(s: str) -> bool:
@@ -97,21 +97,19 @@ def stack_checker(s: str) -> bool:
     -------
     bool:   True if string is balanced, False otherwise
     """
-    opening_brackets = ['[', '(', '{']
-    closing_brackets = [']', ')', '}']
+    opening_brackets = {'[', '(', '{'}
+    matching_bracket = {']': '[', ')': '(', '}': '{'}
     stack = []
+    push = stack.append
+    pop = stack.pop
     for c in s:
         if c in opening_brackets:
-            stack.append(c)
-            continue
-        if c in closing_brackets:
-            try:
-                if opening_brackets.index(stack.pop()) != closing_brackets.index(c):
-                    return False
-            except IndexError:
+            push(c)
+        elif c in matching_bracket:
+            if not stack or pop() != matching_bracket[c]:
                 return False
 
-    return len(stack) == 0
+    return not stack
 
 def test_balanced_parentheses():
     print("----- TESTING BALANCED PARENTHESES -----")
@@ -119,7 +117,7 @@ def test_balanced_parentheses():
         ('()', True), ('[]', True), ('{}', True),
         ("([{}])", True), ("((()))", True), ("()[]", True),
         ("(]", False), ("([)]", False), ("((())", False),
-        ("", True)
+        ("()()", True), ("(()())", True), ("", True)
     ]
 
     for s, expected in test_cases:
@@ -1,4 +1,5 @@
-from typing import List, Dict
+import time
+from typing import List, Dict, Tuple
 
 class Rule:
     def __init__(self, state: int, read_symbol: str, write_symbol: str, next_state: int, direction: str):
@@ -35,12 +36,12 @@ class Rule:
 
         Returns
         -------
-        str Hash of the rule based on state and read_symbol
+        tuple   Hash of the rule based on state and read_symbol
         """
         return Rule.make_hash(self.state, self.read_symbol)
 
     @staticmethod
-    def make_hash(state, read_symbol) -> str:
+    def make_hash(state, read_symbol) -> Tuple[int, str]:
         """
         Create a hash key for rule lookup.
 
@@ -51,9 +52,9 @@ class Rule:
 
         Returns
         -------
-        str Hash key for rule lookup
+        tuple   Hash key for rule lookup
         """
-        return f"{state}{read_symbol}"
+        return (state, read_symbol)
 
 class TuringMachine:
     def __init__(self, rules: List[Rule], input_symbols: str, tape_symbols: str, blank_symbol: str, start_state: int, halt_states: List[int]):
@@ -61,14 +62,45 @@ class TuringMachine:
         Creates a Turing Machine from a list of rules structured like the
         table in the lectures.
         """
+        # the tape stores one latin-1 byte per cell
+        if len(blank_symbol) != 1:
+            raise ValueError("blank_symbol must be one character long")
+        for symbol in input_symbols + tape_symbols + blank_symbol:
+            if ord(symbol) > 255:
+                raise ValueError(f"{symbol} does not fit in a single tape cell")
+
         self.head: int = 0
-        self.tape: str | None = None
+        self.tape: bytearray | None = None
         self.current_state: int = start_state
         self.input_symbols: str = input_symbols
+        # every byte that is not an input symbol, deleted by set_input to check the input
+        self.invalid_input_bytes: bytes = bytes(i for i in range(256) if chr(i) not in input_symbols)
         self.tape_symbols: str = tape_symbols
         self.blank_symbol: str = blank_symbol
         self.halt_states: List[int] = halt_states
-        self.rules: Dict[str, Rule] = {rule.hash: rule for rule in rules}
+        # (write_symbol, next_state, head move) for each (state, read_symbol)
+        self.rules: Dict[Tuple[int, str], Tuple[str, int, int]] = {
+            rule.hash: (rule.write_symbol, rule.next_state, 1 if rule.direction == 'R' else -1)
+            for rule in rules
+        }
+
+        # the same rules as a row per state indexed by the byte under the
+        # head, holding (write byte, next_state, head move). Rules writing an
+        # invalid symbol are left out so step() raises for them.
+        self.transitions: Dict[int, List[Tuple[int, int, int] | None]] = {}
+        # symbols each state moves right over without changing the tape or
+        # its state, so a run can skip the whole stretch at once
+        scans: Dict[int, bytearray] = {}
+        for (state, read_symbol), (write_symbol, next_state, move) in self.rules.items():
+            read_byte = ord(read_symbol)
+            if write_symbol in tape_symbols and read_byte < 256:
+                row = self.transitions.setdefault(state, [None] * 256)
+                row[read_byte] = (ord(write_symbol), next_state, move)
+            if (next_state == state and move == 1 and write_symbol == read_symbol
+                    and write_symbol in tape_symbols and state not in halt_states
+                    and read_byte < 256):
+                scans.setdefault(state, bytearray()).append(read_byte)
+        self.right_scans: Dict[int, bytes] = {state: bytes(syms) for state, syms in scans.items()}
 
     def set_input(self, input_string):
         """
@@ -78,10 +110,15 @@ class TuringMachine:
         ----------
         input_string    Input string to load onto the tape
         """
-        for symbol in input_string:
-            if symbol not in self.input_symbols:
-                raise ValueError("Invalid input symbol")
-        self.tape = input_string
+        try:
+            encoded = input_string.encode('latin-1')
+        except UnicodeEncodeError:
+            raise ValueError("Invalid input symbol") from None
+        # anything deleted by the translate was not an input symbol
+        if len(encoded.translate(None, self.invalid_input_bytes)) != len(encoded):
+            raise ValueError("Invalid input symbol")
+        # one byte per cell so writes happen in place
+        self.tape = bytearray(encoded)
 
     def read_tape(self):
         """
@@ -98,7 +135,7 @@ class TuringMachine:
             raise ValueError("Input not yet provided to Turing Machine")
         if n > len(self.tape) - 1:
             return self.blank_symbol
-        return self.tape[n]
+        return chr(self.tape[n])
 
     def write_tape(self, char: str):
         """
@@ -115,7 +152,10 @@ class TuringMachine:
             raise ValueError("Cannot write to left of first cell")
         if not self.tape:
             raise ValueError("Input not yet provided to Turing Machine")
-        self.tape = self.tape[:n] + char + self.tape[n+1:]
+        if n >= len(self.tape):
+            # grow the tape with blanks up to the head
+            self.tape.extend(self.blank_symbol.encode('latin-1') * (n - len(self.tape) + 1))
+        self.tape[n] = ord(char)
 
     def run(self, max_steps=10000, verbose=False, steps=None):
         """
@@ -127,6 +167,24 @@ class TuringMachine:
         verbose     Print tape state after each step
         steps       'keys' for keypress stepping, or float for timed delay
 
+        Returns
+        -------
+        str 'valid' if halted within max_steps, 'invalid' otherwise
+        """
+        if not verbose and steps is None and self.tape:
+            return self._run_fast(max_steps)
+        return self._run_slow(max_steps, verbose, steps)
+
+    def _run_slow(self, max_steps: int, verbose: bool, steps) -> str:
+        """
+        Run one step() at a time, printing and pausing between steps.
+
+        Parameters
+        ----------
+        max_steps   Maximum number of steps to execute
+        verbose     Print tape state after each step
+        steps       'keys' for keypress stepping, or float for timed delay
+
         Returns
         -------
         str 'valid' if halted within max_steps, 'invalid' otherwise
@@ -142,12 +200,67 @@ class TuringMachine:
             if steps == 'keys':
                 input('')
             elif isinstance(steps, (float, int)):
-                import time
                 time.sleep(steps)
             if not result:
                 return 'valid'
         return 'invalid'
 
+    def _run_fast(self, max_steps: int) -> str:
+        """
+        Run without printing, working on the tape bytes and transition rows
+        directly. Same result as stepping one at a time with step().
+
+        Parameters
+        ----------
+        max_steps   Maximum number of steps to execute
+
+        Returns
+        -------
+        str 'valid' if halted within max_steps, 'invalid' otherwise
+        """
+        tape = self.tape
+        transitions = self.transitions
+        right_scans = self.right_scans
+        halt_states = self.halt_states
+        blank = self.blank_symbol.encode('latin-1')
+        state = self.current_state
+        head = self.head
+        num_steps = 0
+        result = 'invalid'
+        while num_steps < max_steps:
+            scan = right_scans.get(state)
+            if scan is not None and 0 <= head < len(tape) and tape[head] in scan:
+                rest = tape[head:head + max_steps - num_steps]
+                skipped = len(rest) - len(rest.lstrip(scan))
+                head += skipped
+                num_steps += skipped
+                if num_steps >= max_steps:
+                    break
+
+            num_steps += 1
+            if state in halt_states:
+                result = 'valid'
+                break
+            row = transitions.get(state)
+            t = None
+            if head >= 0 and row is not None:
+                t = row[tape[head] if head < len(tape) else blank[0]]
+            if t is None:
+                # no fast transition, so hand this step to the slow path,
+                # which raises the matching error
+                self.current_state, self.head = state, head
+                return self._run_slow(max_steps - num_steps + 1, False, None)
+            if head >= len(tape):
+                # only grow the tape once a rule writes past its end
+                tape.extend(blank * (head - len(tape) + 1))
+            tape[head] = t[0]
+            state = t[1]
+            head += t[2]
+
+        self.current_state = state
+        self.head = head
+        return result
+
     def step(self) -> bool:
         """
         Execute one step of the Turing Machine.
@@ -158,15 +271,14 @@ class TuringMachine:
         """
         if self.current_state in self.halt_states:
             return False
-        current_symbol = self.read_tape()
-        k = Rule.make_hash(self.current_state, current_symbol)
-        if k not in self.rules.keys():
+        rule = self.rules.get((self.current_state, self.read_tape()))
+        if rule is None:
             raise ValueError("Rule not defined for the current state and symbol")
 
-        this_rule = self.rules[k]
-        self.write_tape(this_rule.write_symbol)
-        self.head += 1 if this_rule.direction == 'R' else -1
-        self.current_state = this_rule.next_state
+        write_symbol, next_state, move = rule
+        self.write_tape(write_symbol)
+        self.head += move
+        self.current_state = next_state
         return True
 
     def get_tape_contents(self, strip=True):
@@ -181,11 +293,12 @@ class TuringMachine:
         -------
         str Contents of the tape
         """
-        if not self.tape or not isinstance(self.tape, str):
+        if not self.tape or not isinstance(self.tape, bytearray):
             raise ValueError("Input not yet provided to Turing Machine")
+        tape = self.tape.decode('latin-1')
         if strip:
-            return self.tape.strip(self.blank_symbol)
-        return self.tape
+            return tape.strip(self.blank_symbol)
+        return tape
 
 def create_binary_doubler_tm() -> TuringMachine:
     """
@@ -316,6 +429,64 @@ def test_string_reverser():
         print(test_s, ' -> ', tm.get_tape_contents())
     print()
 
+def run_outcome(tm, input_string, stepped=False, max_steps=10000):
+    """
+    Run a Turing Machine and collect everything a run can change.
+
+    Parameters
+    ----------
+    tm              Turing Machine to run
+    input_string    Input string to load onto the tape
+    stepped         Run one step() at a time instead of the quiet fast path
+    max_steps       Maximum number of steps to execute
+
+    Returns
+    -------
+    tuple   (result or error message, raw tape, head, state)
+    """
+    tm.set_input(input_string)
+    try:
+        if stepped:
+            result = tm._run_slow(max_steps, False, None)
+        else:
+            result = tm.run(max_steps)
+    except ValueError as e:
+        result = str(e)
+    return result, tm.get_tape_contents(False), tm.head, tm.current_state
+
+def test_fast_run():
+    print("TESTING FAST RUN MATCHES STEPPED RUN")
+    test_cases = [
+        # 'c' is an input symbol but not a tape symbol, so writing it back fails
+        (lambda: TuringMachine([Rule(1, 'c', 'c', 1, 'R')], 'c', '_a', '_', 1, [2]), 'ccc'),
+        (create_binary_doubler_tm, '1011'),
+        (create_string_reverser_tm, 'abbab'),
+    ]
+    for create_tm, test_s in test_cases:
+        fast = run_outcome(create_tm(), test_s)
+        stepped = run_outcome(create_tm(), test_s, stepped=True)
+        if fast == stepped:
+            print('SUCCESS: ', end='')
+        else:
+            print('FAILURE: ', end='')
+        print(test_s, ' -> ', fast, '  |  ', stepped)
+
+    # a blank that is not one character would make the fast and stepped runs
+    # disagree, so the machine must refuse it up front
+    for blank in ('', '_^'):
+        try:
+            TuringMachine([Rule(1, 'a', 'a', 1, 'R')], 'a', 'a_^', blank, 1, [2])
+            result = 'accepted'
+        except ValueError as e:
+            result = str(e)
+        if result != 'accepted':
+            print('SUCCESS: ', end='')
+        else:
+            print('FAILURE: ', end='')
+        print(repr(blank), ' -> ', result)
+    print()
+
 if __name__ == '__main__':
     test_binary_doubler()
     test_string_reverser()
+    test_fast_run()